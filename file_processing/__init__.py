@@ -4,10 +4,13 @@ from .file_extractor import (
     PDFExtractor,
     DOCXExtractor
 )
+from .text_normalizer import normalize_chunks, normalize_text
 
 __all__ = [
     "BaseFileExtractor",
     "FileExtractorFactory",
     "PDFExtractor",
-    "DOCXExtractor"
+    "DOCXExtractor",
+    "normalize_chunks",
+    "normalize_text"
 ]
\ No newline at end of file
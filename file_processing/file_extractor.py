@@ -1,30 +1,50 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Iterator
 
 import PyPDF2
 from docx import Document
 
+from .text_normalizer import normalize_chunks
+
 
 class BaseFileExtractor(ABC):
+    # Whether iter_text yields pages that may repeat headers/footers
+    paged = False
+
+    @abstractmethod
+    def iter_text(self, file_path: str) -> Iterator[str]:
+        pass
+
     @abstractmethod
     def extract_text(self, file_path: str) -> str:
         pass
 
+    def iter_normalized_text(self, file_path: str) -> Iterator[str]:
+        return normalize_chunks(self.iter_text(file_path), paged=self.paged)
+
 
 class PDFExtractor(BaseFileExtractor):
-    def extract_text(self, file_path: str) -> str:
-        text = ""
+    paged = True
+
+    def iter_text(self, file_path: str) -> Iterator[str]:
         with open(file_path, 'rb') as file:
             reader = PyPDF2.PdfReader(file)
             for page in reader.pages:
-                text += page.extract_text()
-        return text
+                yield page.extract_text() or ""
+
+    def extract_text(self, file_path: str) -> str:
+        return ''.join(self.iter_text(file_path))
 
 
 class DOCXExtractor(BaseFileExtractor):
-    def extract_text(self, file_path: str) -> str:
+    def iter_text(self, file_path: str) -> Iterator[str]:
         doc = Document(file_path)
-        return '\n'.join([para.text for para in doc.paragraphs])
+        for para in doc.paragraphs:
+            yield para.text
+
+    def extract_text(self, file_path: str) -> str:
+        return '\n'.join(self.iter_text(file_path))
 
 
 class FileExtractorFactory:
@@ -0,0 +1,154 @@
+import re
+from collections import deque
+from typing import Deque, Iterable, Iterator, List, Optional, Set, Tuple
+
+_INLINE_WHITESPACE = re.compile(r"[ \t\f\v\u00a0]+")
+_PAGE_NUMBER = re.compile(r"^(?:page\s*)?\d{1,3}(?:\s*(?:/|of)\s*\d{1,3})?$", re.IGNORECASE)
+
+# A header/footer must appear on this many pages (within the window) to be dropped
+_MIN_REPEATS = 3
+# Pages held back while waiting to see whether their edges repeat
+_LOOKAHEAD = _MIN_REPEATS - 1
+# Pages this short are never treated as carrying headers/footers
+_MIN_FURNITURE_LINES = 3
+
+Edges = Tuple[Optional[str], Optional[str]]
+
+
+def _normalize_line(line: str) -> str:
+    return _INLINE_WHITESPACE.sub(" ", line).strip()
+
+
+def _normalize_lines(chunk: str) -> List[str]:
+    lines = []
+    for raw_line in chunk.splitlines():
+        line = _normalize_line(raw_line)
+        if not line and (not lines or not lines[-1]):
+            continue
+        lines.append(line)
+    while lines and not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def _strip_page_numbers(lines: List[str]) -> List[str]:
+    if len(lines) < _MIN_FURNITURE_LINES:
+        return lines
+    start, end = 0, len(lines)
+    if _PAGE_NUMBER.match(lines[0]):
+        start += 1
+    if _PAGE_NUMBER.match(lines[-1]):
+        end -= 1
+    return lines[start:end]
+
+
+def _page_edges(lines: List[str]) -> Edges:
+    if len(lines) < _MIN_FURNITURE_LINES:
+        return None, None
+    return lines[0], lines[-1]
+
+
+def _is_repeated(line: Optional[str], neighbour_lines: Iterable[Optional[str]], kept: Set[str]) -> bool:
+    if line is None:
+        return False
+    repeats = 1 + sum(neighbour == line for neighbour in neighbour_lines)
+    if repeats < _MIN_REPEATS:
+        return False
+    # The first occurrence stays, e.g. a candidate's name heading every page
+    if line not in kept:
+        kept.add(line)
+        return False
+    return True
+
+
+def _strip_repeated_edges(
+        lines: List[str],
+        edges: Edges,
+        neighbours: List[Edges],
+        kept_headers: Set[str],
+        kept_footers: Set[str]
+) -> List[str]:
+    header, footer = edges
+    strip_header = _is_repeated(header, (edge[0] for edge in neighbours), kept_headers)
+    strip_footer = _is_repeated(footer, (edge[1] for edge in neighbours), kept_footers)
+
+    # A page number sitting just inside a removed header/footer goes with it
+    start, end = 0, len(lines)
+    if strip_header:
+        start += 1
+        if start < end and _PAGE_NUMBER.match(lines[start]):
+            start += 1
+    if strip_footer:
+        end -= 1
+        if start < end and _PAGE_NUMBER.match(lines[end - 1]):
+            end -= 1
+    return lines[start:end]
+
+
+def _format_lines(lines: List[str]) -> Optional[str]:
+    # Blank edges can be exposed once a header/footer has been removed
+    text = "\n".join(lines).strip("\n")
+    return text + "\n" if text else None
+
+
+def _normalize_pages(chunks: Iterable[str]) -> Iterator[str]:
+    previous: Deque[Edges] = deque(maxlen=_LOOKAHEAD)
+    pending: Deque[Tuple[List[str], Edges]] = deque()
+    kept_headers: Set[str] = set()
+    kept_footers: Set[str] = set()
+
+    def emit() -> Optional[str]:
+        lines, edges = pending.popleft()
+        neighbours = list(previous) + [page_edges for _, page_edges in pending]
+        previous.append(edges)
+        return _format_lines(_strip_repeated_edges(lines, edges, neighbours, kept_headers, kept_footers))
+
+    for chunk in chunks:
+        lines = _strip_page_numbers(_normalize_lines(chunk))
+        if not lines:
+            continue
+        pending.append((lines, _page_edges(lines)))
+        if len(pending) > _LOOKAHEAD:
+            text = emit()
+            if text:
+                yield text
+
+    while pending:
+        text = emit()
+        if text:
+            yield text
+
+
+def normalize_chunks(chunks: Iterable[str], paged: bool = True) -> Iterator[str]:
+    """
+    Lazily normalise extracted text chunk by chunk.
+
+    Runs of spaces/tabs are collapsed and blank lines are squeezed. For paged
+    sources, bare page numbers on the first or last line of a page are dropped,
+    and a first/last line is treated as a running header/footer only when it
+    recurs on at least three pages within a small window; its first occurrence
+    is kept and later ones are removed. Pages with fewer than three lines are
+    left intact. At most a few pages are held in memory. Unpaged chunks such as
+    DOCX paragraphs are only cleaned up, with runs of blank paragraphs kept as
+    a single blank line between sections.
+
+    :param chunks: Raw text chunks (pages for PDFs, paragraphs for DOCX)
+    :param paged: Whether each chunk is a page that may carry headers/footers
+    :return: Iterator of normalised chunks, each terminated by a newline
+    """
+    if paged:
+        yield from _normalize_pages(chunks)
+        return
+
+    emitted = separate = False
+    for chunk in chunks:
+        text = _format_lines(_normalize_lines(chunk))
+        if not text:
+            separate = emitted
+            continue
+        yield "\n" + text if separate else text
+        emitted, separate = True, False
+
+
+def normalize_text(text: str) -> str:
+    return "".join(normalize_chunks([text], paged=False))
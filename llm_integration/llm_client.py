@@ -24,8 +24,8 @@ class DeepSeekClient(BaseLLMClient):
 
     def generate_response(self, system_prompt: str, user_input: str) -> str:
         print(f"[INFO] Generating response from DeepSeekClient...")
-        print(f"[DEBUG] System Prompt: {system_prompt}")
-        print(f"[DEBUG] User Input: {user_input}")
+        print(f"[DEBUG] System Prompt: {len(system_prompt)} chars")
+        print(f"[DEBUG] User Input: {len(user_input)} chars")
 
         start_time = time.time()
         progress_thread = threading.Thread(target=self._log_progress, args=(start_time,))
@@ -44,7 +44,10 @@ class DeepSeekClient(BaseLLMClient):
             )
             end_time = time.time()
             print(f"[INFO] Response generated successfully in {end_time - start_time:.2f} seconds.")
-            print(f"[DEBUG] Full Response: {response}")
+            usage = getattr(response, "usage", None)
+            if usage is not None:
+                print(f"[DEBUG] Token usage: {usage.prompt_tokens} prompt, {usage.completion_tokens} completion")
+            # Keep only the message text; the full ChatCompletion is dropped here
             return response.choices[0].message.content
         except Exception as e:
             end_time = time.time()
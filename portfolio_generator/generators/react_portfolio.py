@@ -1,9 +1,9 @@
-import json
 import re
 from abc import ABC, abstractmethod
 from typing import Dict
 
 from llm_integration import DeepSeekClient
+from processing import build_prompt, compact_json, track_peak_memory
 from ..schemas import CodeFile
 
 
@@ -56,37 +56,39 @@ class ReactPortfolioGenerator(BasePortfolioGenerator):
         self.llm_client = llm_client
 
     def generate_code(self, resume_data: dict, design_answers: dict) -> Dict[str, CodeFile]:
-        prompt = self._build_prompt(resume_data, design_answers)
+        with track_peak_memory("portfolio_prompt_build"):
+            prompt = self._build_prompt(resume_data, design_answers)
         response = self.llm_client.generate_response(
             system_prompt="You are an expert React full-stack developer",
             user_input=prompt
         )
-        return self._parse_response(response)
+        del prompt
+        with track_peak_memory("portfolio_response_parse"):
+            return self._parse_response(response)
 
     def _build_prompt(self, resume_data: dict, design_answers: dict) -> str:
-        return PROMPT_TEMPLATE.format(
-            resume_json=json.dumps(resume_data, indent=2),
-            design_choices=json.dumps(design_answers, indent=2),
+        return build_prompt(
+            PROMPT_TEMPLATE,
+            resume_json=compact_json(resume_data),
+            design_choices=compact_json(design_answers),
             file_structure=self._render_file_tree()
         )
 
     def _render_file_tree(self) -> str:
-        return """
-        src/
-        ├── components/
-        │   ├── App.jsx
-        │   ├── Header.jsx
-        │   ├── Experience.jsx
-        │   ├── Projects.jsx
-        │   └── Skills.jsx
-        ├── styles/
-        │   ├── theme.css
-        │   └── components/
-        │       ├── Experience.module.css
-        │       └── Projects.module.css
-        └── data/
-            └── resume.json
-        """
+        return """src/
+├── components/
+│   ├── App.jsx
+│   ├── Header.jsx
+│   ├── Experience.jsx
+│   ├── Projects.jsx
+│   └── Skills.jsx
+├── styles/
+│   ├── theme.css
+│   └── components/
+│       ├── Experience.module.css
+│       └── Projects.module.css
+└── data/
+    └── resume.json"""
 
     def _parse_response(self, raw_response: str) -> Dict[str, CodeFile]:
         pattern = r"=== (.*?) ===\n(.*?)(?=\n===|$)"
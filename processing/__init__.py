@@ -2,8 +2,13 @@ from .resume_parser import (
     BaseResumeParser,
     StructuredResumeParser
 )
+from .prompt_builder import build_prompt, compact_json
+from .memory_profiler import track_peak_memory
 
 __all__ = [
     "BaseResumeParser",
-    "StructuredResumeParser"
+    "StructuredResumeParser",
+    "build_prompt",
+    "compact_json",
+    "track_peak_memory"
 ]
@@ -0,0 +1,36 @@
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, List
+
+# Peak seen so far by each enclosing stage, innermost last
+_stage_peaks: List[int] = []
+
+
+@contextmanager
+def track_peak_memory(stage: str) -> Iterator[None]:
+    """
+    Report the peak traced allocation of a pipeline stage.
+
+    This is a no-op unless tracemalloc is already tracing, so stages can be
+    wrapped unconditionally and profiling switched on by the caller. Stages may
+    be nested: an inner stage folds its peak into the enclosing one before
+    resetting the counter. tracemalloc keeps a single process-wide peak, so the
+    numbers are only meaningful when one thread runs the stages being measured.
+    """
+    if not tracemalloc.is_tracing():
+        yield
+        return
+
+    baseline, peak = tracemalloc.get_traced_memory()
+    if _stage_peaks:
+        _stage_peaks[-1] = max(_stage_peaks[-1], peak)
+    tracemalloc.reset_peak()
+    _stage_peaks.append(baseline)
+    try:
+        yield
+    finally:
+        _, peak = tracemalloc.get_traced_memory()
+        stage_peak = max(_stage_peaks.pop(), peak)
+        if _stage_peaks:
+            _stage_peaks[-1] = max(_stage_peaks[-1], stage_peak)
+        print(f"[INFO] Peak memory for stage '{stage}': {(stage_peak - baseline) / 1024:.1f} KiB")
@@ -0,0 +1,41 @@
+import json
+from string import Formatter
+from typing import Any, Iterable, List, Union
+
+_FORMATTER = Formatter()
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+PromptField = Union[str, Iterable[str]]
+
+
+def compact_json(data: Any) -> str:
+    """
+    Encode data as whitespace-free JSON for use inside prompts.
+    """
+    return _COMPACT_ENCODER.encode(data)
+
+
+def build_prompt(template: str, **fields: PromptField) -> str:
+    """
+    Render a str.format style template into a single string.
+
+    Field values may be plain strings or iterables of string chunks, which
+    lets callers pass a lazy page iterator. Every piece is kept in a list
+    until one final str.join, so peak memory is still roughly twice the
+    rendered size; this avoids extra copies, not the text itself.
+
+    :param template: Template using {name} placeholders and {{ }} escapes
+    :param fields: Value (or chunk iterable) for each placeholder
+    :return: The fully rendered prompt
+    """
+    parts: List[str] = []
+    for literal, field_name, _, _ in _FORMATTER.parse(template):
+        parts.append(literal)
+        if field_name is None:
+            continue
+        value = fields[field_name]
+        if isinstance(value, str):
+            parts.append(value)
+        else:
+            parts.extend(value)
+    return "".join(parts)
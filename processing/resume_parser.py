@@ -1,7 +1,10 @@
 import json
 from abc import ABC, abstractmethod
+from typing import Iterable, Union
 
 from llm_integration.llm_client import BaseLLMClient
+from .memory_profiler import track_peak_memory
+from .prompt_builder import build_prompt, compact_json
 
 
 class BaseResumeParser(ABC):
@@ -9,7 +12,7 @@ class BaseResumeParser(ABC):
         self.llm_client = llm_client
 
     @abstractmethod
-    def parse_resume(self, text: str) -> dict:
+    def parse_resume(self, text: Union[str, Iterable[str]]) -> dict:
         pass
 
 
@@ -122,20 +125,27 @@ class StructuredResumeParser(BaseResumeParser):
             }
         }
 
-    def parse_resume(self, text: str) -> dict:
-        schema_str = json.dumps(self.json_schema, indent=2)
-        prompt = self.PROMPT_TEMPLATE.format(
-            schema=schema_str,
-            content=text
-        )
+        self.schema_str = compact_json(self.json_schema)
+
+    def parse_resume(self, text: Union[str, Iterable[str]]) -> dict:
+        # A lazy chunk iterator is consumed here, so extraction and normalisation
+        # run (and are measured) inside this stage
+        with track_peak_memory("resume_extract_and_prompt_build"):
+            prompt = build_prompt(
+                self.PROMPT_TEMPLATE,
+                schema=self.schema_str,
+                content=text
+            )
 
         response = self.llm_client.generate_response(
             system_prompt="You are an expert resume parser",
             user_input=prompt
         )
+        del prompt
 
         try:
-            return json.loads(response)
+            with track_peak_memory("resume_response_parse"):
+                return json.loads(response)
         except json.JSONDecodeError as e:
             # Add fallback parsing logic here
             raise Exception(e, "failed to parse the response from LLM")
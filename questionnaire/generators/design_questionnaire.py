@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from typing import List
 
 from llm_integration import DeepSeekClient
+from processing import build_prompt, compact_json, track_peak_memory
 from ..schemas import DesignQuestion
 
 
@@ -43,7 +44,8 @@ class DesignQuestionnaireGenerator(BaseQuestionnaireGenerator):
         self.llm_client = llm_client
 
     def generate_questions(self, resume_data: dict) -> List[DesignQuestion]:
-        prompt = PROMPT_TEMPLATE.format(resume_json=json.dumps(resume_data, indent=2))
+        with track_peak_memory("questionnaire_prompt_build"):
+            prompt = build_prompt(PROMPT_TEMPLATE, resume_json=compact_json(resume_data))
 
         response = self.llm_client.generate_response(
             system_prompt="You are a UX-focused portfolio design assistant",
@@ -1,5 +1,6 @@
 # resume_processor/main.py
 import json
+import tracemalloc
 from pathlib import Path
 from typing import Dict, Optional, Callable
 
@@ -16,11 +17,13 @@ class ResumeProcessor:
             api_key: str,
             output_dir: str = "./portfolio",
             temp_dir: str = "./tmp",
-            log_dir: str = "./logs"
+            log_dir: str = "./logs",
+            profile_memory: bool = False
     ):
         self.output_dir = output_dir
         self.temp_dir = temp_dir
         self.log_dir = log_dir
+        self.profile_memory = profile_memory
 
         # Initialize dependencies
         self.llm_client = DeepSeekClient(api_key=api_key)
@@ -51,6 +54,11 @@ class ResumeProcessor:
         :param answer_handler: Function to collect user answers
         :return: Generated files metadata
         """
+        # Leave tracing alone if the caller already started it
+        start_tracing = self.profile_memory and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+
         try:
             print("[INFO] Starting resume processing pipeline...")
 
@@ -86,13 +94,18 @@ class ResumeProcessor:
             self._log_error(f"Processing failed: {str(e)}")
             print(f"[ERROR] Processing failed: {str(e)}")
             raise
+        finally:
+            if start_tracing:
+                tracemalloc.stop()
 
     def _process_step1(self, resume_path: str) -> Dict:
         print(f"[INFO] Extracting text from resume at: {resume_path}...")
         extractor = self.file_extractor_factory.get_extractor(resume_path)
-        text_content = extractor.extract_text(resume_path)
+        # Pages are extracted and normalised lazily while the parser builds its
+        # prompt; the prompt still holds the whole text, so peak memory is not lower
+        text_chunks = extractor.iter_normalized_text(resume_path)
         print("[INFO] Parsing extracted resume content...")
-        return self.resume_parser.parse_resume(text_content)
+        return self.resume_parser.parse_resume(text_chunks)
 
     def _handle_questionnaire(
             self,
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import PyPDF2
+from docx import Document
+
+from file_processing import DOCXExtractor, FileExtractorFactory, PDFExtractor
+
+SAMPLE_PDF = str(Path(__file__).resolve().parent.parent / "Joseph D.pdf")
+
+
+def test_pdf_extract_text_concatenates_pages_unchanged():
+    pages = [page.extract_text() for page in PyPDF2.PdfReader(SAMPLE_PDF).pages]
+
+    assert list(PDFExtractor().iter_text(SAMPLE_PDF)) == pages
+    assert PDFExtractor().extract_text(SAMPLE_PDF) == "".join(pages)
+
+
+def test_pdf_normalized_text_keeps_content():
+    pages = list(PDFExtractor().iter_text(SAMPLE_PDF))
+
+    normalized = "".join(PDFExtractor().iter_normalized_text(SAMPLE_PDF))
+
+    assert normalized.split() == " ".join(pages).split()
+    assert normalized.startswith("Joseph Meghanath. D\n")
+
+
+def test_docx_extract_text_and_normalized_text(tmp_path):
+    paragraphs = ["Jane  Doe", "", "Experience", "Acme\t2020 - 2023", "", "", "Education", "12"]
+    document = Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    path = str(tmp_path / "resume.docx")
+    document.save(path)
+
+    extractor = FileExtractorFactory.get_extractor(path)
+
+    assert isinstance(extractor, DOCXExtractor)
+    assert extractor.extract_text(path) == "\n".join(paragraphs)
+    assert "".join(extractor.iter_normalized_text(path)) == (
+        "Jane Doe\n\nExperience\nAcme 2020 - 2023\n\nEducation\n12\n"
+    )
@@ -0,0 +1,52 @@
+import re
+import tracemalloc
+
+import pytest
+
+from processing import track_peak_memory
+
+
+def _reported_kib(output, stage):
+    match = re.search(rf"stage '{stage}': ([\d.]+) KiB", output)
+    assert match, output
+    return float(match.group(1))
+
+
+@pytest.fixture
+def tracing():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+def test_nested_stage_keeps_outer_peak(tracing, capsys):
+    with track_peak_memory("outer"):
+        buffer = bytearray(2 * 1024 * 1024)
+        del buffer
+        with track_peak_memory("inner"):
+            small = bytearray(64 * 1024)
+        del small
+
+    output = capsys.readouterr().out
+    assert _reported_kib(output, "outer") >= 2048
+    assert 64 <= _reported_kib(output, "inner") < 1024
+
+
+def test_inner_peak_folds_into_outer(tracing, capsys):
+    with track_peak_memory("outer"):
+        with track_peak_memory("inner"):
+            buffer = bytearray(1024 * 1024)
+            del buffer
+
+    output = capsys.readouterr().out
+    assert _reported_kib(output, "outer") >= 1024
+
+
+def test_noop_when_not_tracing(capsys):
+    assert not tracemalloc.is_tracing()
+
+    with track_peak_memory("idle"):
+        bytearray(1024)
+
+    assert not tracemalloc.is_tracing()
+    assert capsys.readouterr().out == ""
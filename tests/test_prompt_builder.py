@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from portfolio_generator.generators.react_portfolio import PROMPT_TEMPLATE as PORTFOLIO_TEMPLATE
+from processing import StructuredResumeParser, build_prompt, compact_json
+from questionnaire.generators.design_questionnaire import PROMPT_TEMPLATE as QUESTIONNAIRE_TEMPLATE
+
+RESUME_DATA = {"personal_info": {"full_name": "José Doe"}, "skills": ["Python", "{braces}"]}
+
+
+@pytest.mark.parametrize("template, fields", [
+    (StructuredResumeParser.PROMPT_TEMPLATE, {"schema": '{"a":1}', "content": "Line {1}\nLine 2\n"}),
+    (PORTFOLIO_TEMPLATE, {"resume_json": "{}", "design_choices": '{"theme":"dark"}', "file_structure": "src/"}),
+    (QUESTIONNAIRE_TEMPLATE, {"resume_json": '{"a":[1]}'}),
+])
+def test_matches_str_format_for_existing_templates(template, fields):
+    assert build_prompt(template, **fields) == template.format(**fields)
+
+
+def test_unescapes_double_braces():
+    assert build_prompt("{{literal}} {value} }}", value="x") == "{literal} x }"
+
+
+def test_streams_chunk_iterables():
+    chunks = iter(["page one\n", "page two\n"])
+
+    assert build_prompt("<{content}>", content=chunks) == "<page one\npage two\n>"
+
+
+def test_compact_json_round_trips_without_whitespace():
+    encoded = compact_json(RESUME_DATA)
+
+    assert json.loads(encoded) == RESUME_DATA
+    assert ", " not in encoded and ": " not in encoded
+    assert "José" in encoded
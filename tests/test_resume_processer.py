@@ -0,0 +1,64 @@
+import tracemalloc
+
+import pytest
+
+from resume_processer import ResumeProcessor
+
+
+class _StubExtractor:
+    def iter_normalized_text(self, path):
+        return iter(["Jane Doe\n"])
+
+
+class _StubParser:
+    def parse_resume(self, text):
+        "".join(text)
+        return {"personal_info": {"full_name": "Jane Doe"}}
+
+
+class _StubQuestionnaire:
+    def generate_questions(self, resume_data):
+        return []
+
+
+class _StubPortfolio:
+    def generate_code(self, resume_data, design_answers):
+        return {}
+
+
+@pytest.fixture
+def processor(tmp_path):
+    processor = ResumeProcessor(
+        api_key="test-key",
+        output_dir=str(tmp_path / "out"),
+        temp_dir=str(tmp_path / "tmp"),
+        log_dir=str(tmp_path / "logs"),
+        profile_memory=True
+    )
+    processor.file_extractor_factory.get_extractor = lambda path: _StubExtractor()
+    processor.resume_parser = _StubParser()
+    processor.questionnaire_gen = _StubQuestionnaire()
+    processor.portfolio_gen = _StubPortfolio()
+    return processor
+
+
+def _run(processor):
+    return processor.process_resume("resume.pdf", answer_handler=lambda questions: {})
+
+
+def test_profile_memory_leaves_caller_tracing_running(processor):
+    tracemalloc.start()
+    try:
+        _run(processor)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_profile_memory_stops_tracing_it_started(processor):
+    assert not tracemalloc.is_tracing()
+
+    result = _run(processor)
+
+    assert not tracemalloc.is_tracing()
+    assert result["resume_data"]["personal_info"]["full_name"] == "Jane Doe"
@@ -0,0 +1,84 @@
+from file_processing import normalize_chunks, normalize_text
+
+
+def _normalize(pages, paged=True):
+    return "".join(normalize_chunks(pages, paged=paged))
+
+
+def test_collapses_whitespace_and_blank_lines():
+    assert normalize_text("John \t  Doe\n\n\n\nEngineer  \n\n") == "John Doe\n\nEngineer\n"
+
+
+def test_running_header_and_footer_kept_once_after_three_pages():
+    pages = [f"ACME CV\nrole {i}\ndetail {i}\nConfidential" for i in range(1, 5)]
+
+    assert _normalize(pages) == "ACME CV\nrole 1\ndetail 1\nConfidential\n" + "".join(
+        f"role {i}\ndetail {i}\n" for i in range(2, 5)
+    )
+
+
+def test_name_header_on_every_page_appears_once():
+    pages = [
+        "Jane Doe\nSoftware Engineer\nSummary text",
+        "Jane Doe\nExperience\nAcme 2020",
+        "Jane Doe\nEducation\nBSc 2016",
+    ]
+
+    normalized = _normalize(pages)
+
+    assert normalized.count("Jane Doe") == 1
+    assert normalized.startswith("Jane Doe\nSoftware Engineer\n")
+
+
+def test_edges_repeated_on_two_pages_are_kept():
+    pages = ["ACME CV\nrole 1\nConfidential", "ACME CV\nrole 2\nConfidential"]
+
+    assert _normalize(pages) == "ACME CV\nrole 1\nConfidential\nACME CV\nrole 2\nConfidential\n"
+
+
+def test_repeated_section_heading_on_short_pages_is_kept():
+    pages = ["Skills\nPython", "Skills\nJava", "Skills\nGo"]
+
+    assert _normalize(pages) == "Skills\nPython\nSkills\nJava\nSkills\nGo\n"
+
+
+def test_single_line_pages_are_kept():
+    pages = ["Summary", "Summary", "Summary"]
+
+    assert _normalize(pages) == "Summary\nSummary\nSummary\n"
+
+
+def test_page_numbers_on_page_edges_removed():
+    pages = ["1\nrole a\ndetail a", "role b\ndetail b\nPage 2 of 3", "role c\ndetail c\n3 / 3"]
+
+    assert _normalize(pages) == "role a\ndetail a\nrole b\ndetail b\nrole c\ndetail c\n"
+
+
+def test_page_number_inside_running_footer_removed():
+    pages = [f"role {i}\ndetail {i}\nPage {i}\nConfidential" for i in range(1, 4)]
+
+    assert _normalize(pages) == "role 1\ndetail 1\nPage 1\nConfidential\n" + "".join(
+        f"role {i}\ndetail {i}\n" for i in range(2, 4)
+    )
+
+
+def test_numeric_content_lines_kept():
+    pages = ["Team size\n12\nReports\n40\nDone", "Users\n250\nEnd"]
+
+    assert _normalize(pages) == "Team size\n12\nReports\n40\nDone\nUsers\n250\nEnd\n"
+
+
+def test_normalize_text_keeps_numeric_lines():
+    assert normalize_text("Team of 12\n12\n...") == "Team of 12\n12\n...\n"
+
+
+def test_unpaged_paragraphs_never_stripped():
+    paragraphs = ["Skills", "Python", "12", "Skills", "", "Java", "12", "Skills", "3"]
+
+    assert _normalize(paragraphs, paged=False) == "Skills\nPython\n12\nSkills\n\nJava\n12\nSkills\n3\n"
+
+
+def test_unpaged_blank_paragraph_runs_become_one_section_break():
+    paragraphs = ["", "Experience", "", "", " ", "Education", ""]
+
+    assert _normalize(paragraphs, paged=False) == "Experience\n\nEducation\n"